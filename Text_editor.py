@@ -1,15 +1,57 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, font, colorchooser, messagebox
 from ctypes import *
-import platform, os
+import platform, os, threading, time
+
+# Cold-start budget, measured from module import.
+# First paint: the main window is drawn and accepts plain typing.
+# Interactive: the C backend is loaded, so undo, autocomplete and autocorrect work.
+START_TIME = time.perf_counter()
+FIRST_PAINT_TARGET_MS = 250
+INTERACTIVE_TARGET_MS = 1000
+
+# Mirrors the limits in c_ds/editor_core.c.
+MAX_TEXT = 5000
+MAX_WORD_LEN = 64
+MAX_SUGGESTIONS = 5
+BATCH_WORDS = 64
+
+
+def elapsed_ms():
+    return (time.perf_counter() - START_TIME) * 1000
 
 
 class BackendManager:
     def __init__(self):
         self.lib = None
-        self.load_library()
+        self.error = None
+        self.ready = threading.Event()
+        self.thread = None
+
+    def start(self):
+        # Load on a worker thread so the window can paint while the C side
+        # parses the dictionary. Only ctypes work happens here, never Tk calls.
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.load_library, daemon=True)
+            self.thread.start()
+
+    def is_ready(self):
+        return self.ready.is_set() and self.error is None
+
+    def wait(self):
+        self.start()
+        self.ready.wait()
+        return self.error is None
 
     def load_library(self):
+        try:
+            self.lib = self.open_library()
+        except Exception as e:
+            self.error = e
+        finally:
+            self.ready.set()
+
+    def open_library(self):
         system = platform.system()
         if system == "Windows":
             lib_name = "libds.dll"  
@@ -27,38 +69,100 @@ class BackendManager:
         lib_path = next((p for p in paths if os.path.exists(p)), None)
 
         if not lib_path:
-            messagebox.showerror("System Error", "Critical: C Library not found.\nPlease compile 'editor_core.c' into 'c_ds/libds.dll' (or .so).")
-            exit(1)
+            raise FileNotFoundError("Critical: C Library not found.\nPlease compile 'editor_core.c' into 'c_ds/libds.dll' (or .so).")
+
+        lib = CDLL(lib_path)
+        lib.init()
+
+        lib.push_undo_state_n.argtypes = [c_char_p, c_int]
+        lib.perform_undo_n.argtypes = [c_char_p, c_int, c_char_p, c_int]
+        lib.perform_undo_n.restype = c_int
+        lib.perform_redo_n.argtypes = [c_char_p, c_int, c_char_p, c_int]
+        lib.perform_redo_n.restype = c_int
+        lib.save_file_n.argtypes = [c_char_p, c_char_p, c_int]
+
+        batch_args = [c_char_p, c_int, POINTER(c_int), c_char_p, c_int]
+        lib.autocomplete_batch.argtypes = batch_args
+        lib.autocomplete_batch.restype = c_int
+        lib.autocorrect_batch.argtypes = batch_args
+        lib.autocorrect_batch.restype = c_int
+        lib.autocomplete_packed.argtypes = [c_char_p, c_char_p]
+        lib.autocomplete_packed.restype = c_int
+        lib.autocorrect_packed.argtypes = [c_char_p, c_char_p]
+        lib.autocorrect_packed.restype = c_int
+        return lib
+
+    def report_error(self):
+        if isinstance(self.error, FileNotFoundError):
+            messagebox.showerror("System Error", str(self.error))
+        else:
+            messagebox.showerror("Linker Error", f"Failed to load C functions: {self.error}")
+        exit(1)
 
-        try:
-            self.lib = CDLL(lib_path)
-            self.lib.init()
-       
-            self.lib.push_undo_state.argtypes = [c_char_p]
-            self.lib.perform_undo.argtypes = [c_char_p, c_char_p]
-            self.lib.perform_undo.restype = c_int
-            self.lib.perform_redo.argtypes = [c_char_p, c_char_p]
-            self.lib.perform_redo.restype = c_int
-
-            self.lib.save_file.argtypes = [c_char_p, c_char_p]
-            self.lib.free_mem.argtypes = [c_void_p]
-            self.lib.autocomplete.argtypes = [
-                c_char_p,
-                (c_char * 64) * 5
-            ]
-            self.lib.autocomplete.restype = c_int
-
-            self.lib.autocorrect.argtypes = [
-                c_char_p,
-                (c_char * 64) * 5
-            ]
-            self.lib.autocorrect.restype = c_int
+backend = BackendManager()
 
-        except Exception as e:
-            messagebox.showerror("Linker Error", f"Failed to load C functions: {e}")
-            exit(1)
 
-backend = BackendManager()
+class BackendSession:
+    """Reusable ctypes buffers for one tab's calls into the backend.
+
+    Results come back in one packed blob (NUL-separated suggestions) that is
+    decoded in a single step, instead of a fresh array read slot by slot.
+    """
+
+    def __init__(self):
+        self.text_out = create_string_buffer(MAX_TEXT)
+        self.word_blob = create_string_buffer(MAX_SUGGESTIONS * MAX_WORD_LEN)
+        self.offsets = (c_int * (BATCH_WORDS + 1))()
+        self.blob = create_string_buffer(BATCH_WORDS * MAX_SUGGESTIONS * MAX_WORD_LEN)
+
+    def autocomplete(self, word):
+        return self.suggest_one(backend.lib.autocomplete_packed, word)
+
+    def autocorrect(self, word):
+        return self.suggest_one(backend.lib.autocorrect_packed, word)
+
+    def autocomplete_many(self, words):
+        return self.suggest(backend.lib.autocomplete_batch, words)
+
+    def autocorrect_many(self, words):
+        return self.suggest(backend.lib.autocorrect_batch, words)
+
+    def suggest_one(self, fn, word):
+        used = fn(word.encode('utf-8'), self.word_blob)
+        if not used:
+            return []
+        # Drop the trailing NUL so split() yields no empty last entry.
+        return self.word_blob.raw[:used - 1].decode('utf-8').split('\0')
+
+    def suggest(self, fn, words):
+        # One list of suggestions per input word, in order.
+        results = []
+        for start in range(0, len(words), BATCH_WORDS):
+            chunk = words[start:start + BATCH_WORDS]
+            packed = b'\0'.join(w.encode('utf-8') for w in chunk) + b'\0'
+            used = fn(packed, len(chunk), self.offsets, self.blob, len(self.blob))
+            items = str(memoryview(self.blob)[:used], 'utf-8').split('\0')
+            offsets = self.offsets[:len(chunk) + 1]
+            for i in range(len(chunk)):
+                results.append(items[offsets[i]:offsets[i + 1]])
+        return results
+
+    def push_undo(self, data):
+        backend.lib.push_undo_state_n(data, len(data))
+
+    def undo(self, current):
+        return self.read_text(backend.lib.perform_undo_n(current, len(current), self.text_out, MAX_TEXT))
+
+    def redo(self, current):
+        return self.read_text(backend.lib.perform_redo_n(current, len(current), self.text_out, MAX_TEXT))
+
+    def save(self, filepath, data):
+        backend.lib.save_file_n(filepath.encode('utf-8'), data, len(data))
+
+    def read_text(self, size):
+        if size < 0:
+            return None
+        return str(memoryview(self.text_out)[:size], 'utf-8')
 
 
 class AdvancedText(tk.Frame):
@@ -98,6 +202,7 @@ class AdvancedText(tk.Frame):
         self.autocorrect_label = None
         self.save_timer = None
         self.is_restoring = False
+        self.session = BackendSession()
 
     def focus_autocomplete(self, event):
         if self.autocomplete_list:
@@ -164,25 +269,16 @@ class AdvancedText(tk.Frame):
                 prev_word = c + prev_word
             
             # Show autocorrect for the previous word
-            if len(prev_word) >= 2:
-                suggestions = ((c_char * 64) * 5)()
-                count = backend.lib.autocorrect(prev_word.encode(), suggestions)
+            if len(prev_word) >= 2 and backend.is_ready():
+                suggestions = self.session.autocorrect(prev_word)
                 
                 # Filter to only suggestions with same length as typed word
-                if count > 0:
-                    filtered_suggestions = []
+                if suggestions:
                     word_len = len(prev_word)
-                    for i in range(count):
-                        sugg = suggestions[i].value.decode()
-                        if len(sugg) == word_len:
-                            filtered_suggestions.append(sugg)
+                    filtered_suggestions = [s for s in suggestions if len(s) == word_len]
                     
                     if filtered_suggestions:
-                        # Convert back to ctypes array for consistency
-                        filtered_array = ((c_char * 64) * 5)()
-                        for i, sugg in enumerate(filtered_suggestions[:5]):
-                            filtered_array[i].value = sugg.encode()
-                        self.show_autocorrect_for_word(prev_word, filtered_array, len(filtered_suggestions))
+                        self.show_autocorrect_for_word(prev_word, filtered_suggestions)
                     else:
                         self.hide_autocorrect()
                 else:
@@ -216,9 +312,14 @@ class AdvancedText(tk.Frame):
 
 
     def push_state_to_c(self):
-       
+        # Typing works before the backend is loaded; retry until it is.
+        if not backend.is_ready():
+            self.save_timer = self.after(300, self.push_state_to_c)
+            return
+
+        self.save_timer = None
         content = self.text.get("1.0", "end-1c").encode('utf-8')
-        backend.lib.push_undo_state(content)
+        self.session.push_undo(content)
 
     def get_current_word(self):
         index = self.text.index(tk.INSERT)
@@ -241,14 +342,13 @@ class AdvancedText(tk.Frame):
 
     def show_autocomplete(self):
         prefix = self.get_current_word()
-        if len(prefix) < 2:
+        if len(prefix) < 2 or not backend.is_ready():
             self.hide_autocomplete()
             return
 
-        suggestions = ((c_char * 64) * 5)()
-        count = backend.lib.autocomplete(prefix.encode(), suggestions)
+        suggestions = self.session.autocomplete(prefix)
 
-        if count == 0:
+        if not suggestions:
             self.hide_autocomplete()
             return
 
@@ -260,8 +360,7 @@ class AdvancedText(tk.Frame):
         self.autocomplete_list.bind("<ButtonRelease-1>", self.apply_suggestion)
         self.autocomplete_list.bind("<Return>", self.apply_suggestion)
         
-        for i in range(count):
-            self.autocomplete_list.insert(tk.END, suggestions[i].value.decode())
+        self.autocomplete_list.insert(tk.END, *suggestions)
 
         bbox = self.text.bbox(tk.INSERT)
         if not bbox:
@@ -312,7 +411,7 @@ class AdvancedText(tk.Frame):
 
 
 
-    def show_autocorrect_for_word(self, word, suggestions, count):
+    def show_autocorrect_for_word(self, word, suggestions):
         """Show autocorrect popup for a specific word with given suggestions"""
         # Create popup if needed
         if not self.autocorrect_popup:
@@ -325,14 +424,11 @@ class AdvancedText(tk.Frame):
         for widget in self.autocorrect_popup.winfo_children():
             widget.destroy()
 
-        # Show up to 2 suggestions
-        limit = min(count, 2)
-        
         header = tk.Label(self.autocorrect_popup, text="Did you mean?", bg="#ffffe0", font=("Arial", 8, "bold"))
         header.pack(anchor="w", padx=2)
 
-        for i in range(limit):
-            sugg = suggestions[i].value.decode()
+        # Show up to 2 suggestions
+        for sugg in suggestions[:2]:
             lbl = tk.Label(
                 self.autocorrect_popup, 
                 text=sugg, 
@@ -349,69 +445,28 @@ class AdvancedText(tk.Frame):
         # Position below the cursor
         bbox = self.text.bbox(tk.INSERT)
         if not bbox:
-            return
+            return False
 
         x, y, w, h = bbox
         abs_x = self.text.winfo_rootx() + x
         abs_y = self.text.winfo_rooty() + y + h + 5
         
         self.autocorrect_popup.geometry(f"+{abs_x}+{abs_y}")
+        return True
 
     def show_autocorrect(self):
         prefix = self.get_current_word()
-        if len(prefix) < 2:
+        if len(prefix) < 2 or not backend.is_ready():
             self.hide_autocorrect()
             return False
         
-        suggestions = ((c_char * 64) * 5)()
-        count = backend.lib.autocorrect(prefix.encode(), suggestions)
+        suggestions = self.session.autocorrect(prefix)
         
-        if count == 0:
+        if not suggestions:
             self.hide_autocorrect()
             return False
 
-        # Create popup if needed
-        if not self.autocorrect_popup:
-            self.autocorrect_popup = tk.Toplevel(self)
-            self.autocorrect_popup.wm_overrideredirect(True)
-            self.autocorrect_popup.attributes("-topmost", True)
-            self.autocorrect_popup.config(bg="#ffffe0", bd=1, relief=tk.SOLID)
-        
-        # Clear existing widgets
-        for widget in self.autocorrect_popup.winfo_children():
-            widget.destroy()
-
-        # Show up to 2 suggestions
-        limit = min(count, 2)
-        
-        header = tk.Label(self.autocorrect_popup, text="Did you mean?", bg="#ffffe0", font=("Arial", 8, "bold"))
-        header.pack(anchor="w", padx=2)
-
-        for i in range(limit):
-            sugg = suggestions[i].value.decode()
-            lbl = tk.Label(
-                self.autocorrect_popup, 
-                text=sugg, 
-                bg="#ffffe0", 
-                fg="blue",
-                font=("Arial", 10, "underline"),
-                padx=5, pady=1,
-                cursor="hand2"
-            )
-            lbl.pack(anchor="w")
-            lbl.bind("<Button-1>", lambda e, s=sugg: self.apply_correction(s))
-
-        # Position below the cursor
-        bbox = self.text.bbox(tk.INSERT)
-        if not bbox:
-            return False
-
-        x, y, w, h = bbox
-        abs_x = self.text.winfo_rootx() + x
-        abs_y = self.text.winfo_rooty() + y + h + 5
-        
-        self.autocorrect_popup.geometry(f"+{abs_x}+{abs_y}")
-        return True
+        return self.show_autocorrect_for_word(prefix, suggestions)
 
 
     def hide_autocorrect(self):
@@ -488,7 +543,7 @@ class ResearchEditor(tk.Tk):
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
        
-        self.status_var = tk.StringVar(value="Ready")
+        self.status_var = tk.StringVar(value="Loading dictionary...")
         self.status_bar = tk.Label(self, textvariable=self.status_var, bd=1, relief=tk.SUNKEN, anchor=tk.W, padx=10)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
@@ -503,7 +558,43 @@ class ResearchEditor(tk.Tk):
         self.bind("<Control-u>", lambda e: self.format_text("underline"))
 
         
+        self.first_paint_ms = None
+        self.interactive_ms = None
+
         self.file_new()
+        self.status_var.set("Loading dictionary...")
+
+        backend.start()
+        self.paint_binding = self.bind("<Expose>", self.mark_first_paint, add="+")
+        self.after(20, self.poll_backend)
+
+    def mark_first_paint(self, event=None):
+        # <Expose> is delivered once the window is actually on screen and
+        # needs drawing, unlike an idle callback queued before mainloop().
+        if self.first_paint_ms is None:
+            self.first_paint_ms = elapsed_ms()
+            self.unbind("<Expose>", self.paint_binding)
+            self.show_startup_times()
+
+    def poll_backend(self):
+        if not backend.ready.is_set():
+            self.after(20, self.poll_backend)
+            return
+
+        if backend.error:
+            backend.report_error()
+
+        self.interactive_ms = elapsed_ms()
+        self.show_startup_times()
+
+    def show_startup_times(self):
+        if self.first_paint_ms is None or self.interactive_ms is None:
+            return
+
+        status = f"Ready (first paint {self.first_paint_ms:.0f} ms, interactive {self.interactive_ms:.0f} ms)"
+        if self.first_paint_ms > FIRST_PAINT_TARGET_MS or self.interactive_ms > INTERACTIVE_TARGET_MS:
+            status += f" - over startup target ({FIRST_PAINT_TARGET_MS} / {INTERACTIVE_TARGET_MS} ms)"
+        self.status_var.set(status)
 
     
     def create_menus(self):
@@ -561,13 +652,16 @@ class ResearchEditor(tk.Tk):
         tk.Button(toolbar, text="Undo", command=self.edit_undo).pack(side = tk.RIGHT, padx = 5, pady = 5)
 
    
-    def get_active_editor(self):
+    def get_active_tab(self):
         try:
-            tab_id = self.notebook.select()
-            return self.notebook.nametowidget(tab_id).text
+            return self.notebook.nametowidget(self.notebook.select())
         except:
             return None
 
+    def get_active_editor(self):
+        tab = self.get_active_tab()
+        return tab.text if tab else None
+
     def file_new(self):
         editor_frame = AdvancedText(self.notebook)
         self.notebook.add(editor_frame, text="Untitled")
@@ -584,17 +678,18 @@ class ResearchEditor(tk.Tk):
             with open(filepath, 'r', encoding='utf-8') as f:
                 content = f.read()
                 editor.insert("1.0", content)
-              
-                backend.lib.push_undo_state(content.encode('utf-8'))
             
           
-            current_tab = self.notebook.nametowidget(self.notebook.select())
+            current_tab = self.get_active_tab()
+            current_tab.push_state_to_c()
             self.file_map[current_tab] = filepath
             self.notebook.tab(current_tab, text=os.path.basename(filepath))
             self.status_var.set(f"Opened: {filepath}")
 
     def file_save(self):
-        current_tab = self.notebook.nametowidget(self.notebook.select())
+        current_tab = self.get_active_tab()
+        if not current_tab:
+            return
         editor = current_tab.text
         filepath = self.file_map.get(current_tab)
 
@@ -605,23 +700,30 @@ class ResearchEditor(tk.Tk):
             self.notebook.tab(current_tab, text=os.path.basename(filepath))
 
         content = editor.get("1.0", tk.END).encode('utf-8')
-       
-        backend.lib.save_file(filepath.encode('utf-8'), content)
+
+        # Saving must not be dropped, so block until the backend is loaded.
+        if not backend.wait():
+            self.status_var.set("Save failed: backend unavailable")
+            return
+        current_tab.session.save(filepath, content)
         self.status_var.set(f"Saved to {filepath}")
 
     def edit_undo(self, event=None):
         editor = self.get_active_editor()
         if not editor:
             return "break"
+        if not backend.is_ready():
+            self.status_var.set("Undo is available once the dictionary has loaded")
+            return "break"
 
         current = editor.get("1.0", tk.END).encode()
-        buffer = create_string_buffer(5000)
 
         editor.master.is_restoring = True
 
-        if backend.lib.perform_undo(current, buffer):
+        text = editor.master.session.undo(current)
+        if text is not None:
             editor.delete("1.0", tk.END)
-            editor.insert("1.0", buffer.value.decode())
+            editor.insert("1.0", text)
             editor.mark_set(tk.INSERT, "end-1c")
             self.status_var.set("Undo")
         else:
@@ -635,13 +737,16 @@ class ResearchEditor(tk.Tk):
         editor = self.get_active_editor()
         if not editor:
             return "break"
+        if not backend.is_ready():
+            self.status_var.set("Redo is available once the dictionary has loaded")
+            return "break"
 
         current = editor.get("1.0", tk.END).encode()
-        buffer = create_string_buffer(5000)
 
-        if backend.lib.perform_redo(current, buffer):
+        text = editor.master.session.redo(current)
+        if text is not None:
             editor.delete("1.0", tk.END)
-            editor.insert("1.0", buffer.value.decode())
+            editor.insert("1.0", text)
             editor.mark_set("insert", "end-1c")
             self.status_var.set("Redo")
         else:
@@ -34,8 +34,8 @@ void stack_init(Stack *s) { s->top = -1; }
 
 void stack_clear(Stack *s) { s->top = -1; }
 
-void stack_push(Stack *s, const char *text) {
-  if (!text)
+void stack_push_n(Stack *s, const char *text, int len) {
+  if (!text || len < 0)
     return;
 
   if (s->top < MAX_HISTORY - 1) {
@@ -45,8 +45,16 @@ void stack_push(Stack *s, const char *text) {
     for (int i = 1; i < MAX_HISTORY; i++)
       strcpy(s->data[i - 1], s->data[i]);
   }
-  strncpy(s->data[s->top], text, MAX_TEXT - 1);
-  s->data[s->top][MAX_TEXT - 1] = '\0';
+  if (len > MAX_TEXT - 1)
+    len = MAX_TEXT - 1;
+  memcpy(s->data[s->top], text, len);
+  s->data[s->top][len] = '\0';
+}
+
+void stack_push(Stack *s, const char *text) {
+  if (!text)
+    return;
+  stack_push_n(s, text, strnlen(text, MAX_TEXT - 1));
 }
 
 int stack_pop(Stack *s, char *out) {
@@ -63,6 +71,19 @@ int stack_peek(Stack *s, char *out) {
   return 1;
 }
 
+// Copies the top entry into out (at most cap bytes, NUL-terminated).
+// Returns the number of bytes written, excluding the NUL, or -1 if empty.
+int stack_peek_n(Stack *s, char *out, int cap) {
+  if (s->top < 0 || cap <= 0)
+    return -1;
+  int len = strlen(s->data[s->top]);
+  if (len > cap - 1)
+    len = cap - 1;
+  memcpy(out, s->data[s->top], len);
+  out[len] = '\0';
+  return len;
+}
+
 /* ================= TRIE OPS ================= */
 
 TrieNode *trie_node() { return (TrieNode *)calloc(1, sizeof(TrieNode)); }
@@ -152,6 +173,18 @@ EXPORT void save_file(const char *filename, const char *text) {
   fclose(f);
 }
 
+EXPORT void save_file_n(const char *filename, const char *text, int len) {
+  if (!filename || !text || len < 0)
+    return;
+
+  FILE *f = fopen(filename, "w");
+  if (!f)
+    return;
+
+  fwrite(text, 1, len, f);
+  fclose(f);
+}
+
 EXPORT void push_undo_state(const char *text) {
   stack_push(&undoStack, text);
   stack_clear(&redoStack);
@@ -176,6 +209,37 @@ EXPORT int perform_redo(const char *current, char *out) {
   return stack_pop(&redoStack, out);
 }
 
+/*
+ * Length-aware variants: the caller passes the byte length of current and a
+ * reusable output buffer, and gets back the number of bytes written (or -1
+ * when there is nothing to undo/redo), so no NUL scan or fresh buffer is
+ * needed on the Python side.
+ */
+
+EXPORT void push_undo_state_n(const char *text, int len) {
+  stack_push_n(&undoStack, text, len);
+  stack_clear(&redoStack);
+}
+
+EXPORT int perform_undo_n(const char *current, int len, char *out, int cap) {
+  if (undoStack.top <= 0)
+    return -1;
+
+  stack_push_n(&redoStack, current, len);
+  undoStack.top--;
+  return stack_peek_n(&undoStack, out, cap);
+}
+
+EXPORT int perform_redo_n(const char *current, int len, char *out, int cap) {
+  if (redoStack.top < 0)
+    return -1;
+
+  stack_push_n(&undoStack, current, len);
+  int n = stack_peek_n(&redoStack, out, cap);
+  redoStack.top--;
+  return n;
+}
+
 EXPORT int autocomplete(const char *prefix,
                         char suggestions[MAX_SUGGESTIONS][MAX_WORD_LEN]) {
   TrieNode *cur = root;
@@ -318,3 +382,72 @@ EXPORT int autocorrect(const char *word,
   free(current_row);
   return count;
 }
+
+/* ================= BATCH ================= */
+
+/*
+ * Packed result format shared by the batch entry points.
+ *
+ * words holds n_words NUL-terminated strings back to back. Every suggestion
+ * is written to blob followed by a NUL, and offsets (n_words + 1 ints) holds
+ * the running suggestion count, so the suggestions for word i are entries
+ * offsets[i] .. offsets[i + 1] - 1 of the blob. Returns the number of blob
+ * bytes used. Words that do not fit in blob_cap get no suggestions.
+ */
+
+typedef int (*suggest_fn)(const char *, char[MAX_SUGGESTIONS][MAX_WORD_LEN]);
+
+static int batch_collect(suggest_fn fn, const char *words, int n_words,
+                         int *offsets, char *blob, int blob_cap) {
+  char suggestions[MAX_SUGGESTIONS][MAX_WORD_LEN];
+  int used = 0;
+  int total = 0;
+
+  offsets[0] = 0;
+  for (int w = 0; w < n_words; w++) {
+    int len = strlen(words);
+    int count = 0;
+    if (len > 0 && len < MAX_WORD_LEN)
+      count = fn(words, suggestions);
+
+    for (int i = 0; i < count; i++) {
+      int n = strlen(suggestions[i]) + 1;
+      if (used + n > blob_cap)
+        break;
+      memcpy(blob + used, suggestions[i], n);
+      used += n;
+      total++;
+    }
+    offsets[w + 1] = total;
+    words += len + 1;
+  }
+  return used;
+}
+
+EXPORT int autocomplete_batch(const char *words, int n_words, int *offsets,
+                              char *blob, int blob_cap) {
+  return batch_collect(autocomplete, words, n_words, offsets, blob, blob_cap);
+}
+
+EXPORT int autocorrect_batch(const char *words, int n_words, int *offsets,
+                             char *blob, int blob_cap) {
+  return batch_collect(autocorrect, words, n_words, offsets, blob, blob_cap);
+}
+
+/*
+ * Single-word variants of the above for the per-keystroke path: blob must
+ * hold MAX_SUGGESTIONS * MAX_WORD_LEN bytes, and offsets are not needed
+ * since every entry belongs to the one word.
+ */
+
+EXPORT int autocomplete_packed(const char *word, char *blob) {
+  int offsets[2];
+  return batch_collect(autocomplete, word, 1, offsets, blob,
+                       MAX_SUGGESTIONS * MAX_WORD_LEN);
+}
+
+EXPORT int autocorrect_packed(const char *word, char *blob) {
+  int offsets[2];
+  return batch_collect(autocorrect, word, 1, offsets, blob,
+                       MAX_SUGGESTIONS * MAX_WORD_LEN);
+}